@@ -4,46 +4,41 @@ import sys
 
 from voussoirkit import pipeable
 
-def _render_colons(hours, minutes, seconds):
-    parts = []
-    if hours is not None:
-        parts.append(f'{hours:02d}:')
-    if minutes is not None:
-        parts.append(f'{minutes:02d}:')
-    parts.append(f'{seconds:02d}')
-
-    return ''.join(parts)
-
-def _render_letters(hours, minutes, seconds):
-    parts = []
-    if hours is not None:
-        parts.append(f'{hours:02d}h')
-    if minutes is not None:
-        parts.append(f'{minutes:02d}m')
-    parts.append(f'{seconds:02d}s')
-
-    return ''.join(parts)
+OUTPUT_BATCH_SIZE = 1000
+
+HMS_LETTERS_PATTERN = re.compile(r'(?:(\d+)h)?(?:(\d+)m)?(\d+)s?')
+
+# These are keyed by (show_hours, show_minutes) so that _seconds_to_hms can
+# pick the right format once instead of assembling the string piece by piece.
+_COLONS_FORMATS = {
+    (False, False): '{seconds:02d}'.format,
+    (False, True): '{minutes:02d}:{seconds:02d}'.format,
+    (True, True): '{hours:02d}:{minutes:02d}:{seconds:02d}'.format,
+}
+
+_LETTERS_FORMATS = {
+    (False, False): '{seconds:02d}s'.format,
+    (False, True): '{minutes:02d}m{seconds:02d}s'.format,
+    (True, True): '{hours:02d}h{minutes:02d}m{seconds:02d}s'.format,
+}
 
 def hms_to_seconds(hms) -> float:
     '''
     Convert hh:mm:ss string to an integer or float of seconds.
     '''
     parts = hms.split(':')
-    seconds = 0
     if len(parts) > 3:
         raise ValueError(f'{hms} doesn\'t match the HH:MM:SS format.')
+    seconds = 0
     if len(parts) == 3:
-        seconds += int(parts[0]) * 3600
-        parts.pop(0)
-    if len(parts) == 2:
-        seconds += int(parts[0]) * 60
-        parts.pop(0)
-    if len(parts) == 1:
-        seconds += float(parts[0])
+        seconds += int(parts[-3]) * 3600
+    if len(parts) >= 2:
+        seconds += int(parts[-2]) * 60
+    seconds += float(parts[-1])
     return seconds
 
 def hms_letters_to_seconds(hms) -> float:
-    match = re.match(r'(?:(\d+)h)?(?:(\d+)m)?(\d+)s?', hms.strip())
+    match = HMS_LETTERS_PATTERN.match(hms.strip())
     if not match:
         raise ValueError(f'{hms} does not match 00h00m00s pattern')
     (hours, minutes, seconds) = match.groups()
@@ -62,7 +57,7 @@ def rounds(seconds):
 
 def _seconds_to_hms(
         seconds,
-        renderer,
+        formats,
         *,
         force_minutes=False,
         force_hours=False,
@@ -71,37 +66,54 @@ def _seconds_to_hms(
     (minutes, seconds) = divmod(seconds, 60)
     (hours, minutes) = divmod(minutes, 60)
 
-    if not (hours or force_hours):
-        hours = None
-
-    if not (minutes or hours or force_hours or force_minutes):
-        minutes = None
+    show_hours = bool(hours or force_hours)
+    show_minutes = bool(show_hours or minutes or force_minutes)
 
-    return renderer(hours, minutes, seconds)
+    formatter = formats[(show_hours, show_minutes)]
+    return formatter(hours=hours, minutes=minutes, seconds=seconds)
 
 def seconds_to_hms(seconds, **kwargs) -> str:
     '''
     Convert integer number of seconds to an hh:mm:ss string.
     Only the necessary fields are used.
     '''
-    return _seconds_to_hms(seconds, renderer=_render_colons, **kwargs)
+    return _seconds_to_hms(seconds, formats=_COLONS_FORMATS, **kwargs)
 
 def seconds_to_hms_letters(seconds, **kwargs) -> str:
-    return _seconds_to_hms(seconds, renderer=_render_letters, **kwargs)
+    return _seconds_to_hms(seconds, formats=_LETTERS_FORMATS, **kwargs)
 
 def main(args):
     lines = pipeable.input_many(args, strip=True, skip_blank=True)
-    for line in lines:
-        if ':' in line:
-            line = hms_to_seconds(line)
-        elif 's' in line:
-            line = hms_letters_to_seconds(line)
-        else:
-            line = float(line)
-            if line > 60:
-                line = seconds_to_hms(line)
-
-        pipeable.stdout(line)
+    # Results are written in batches instead of one pipeable.stdout call per
+    # line, which matters when thousands of timestamps are piped in.
+    output = []
+    # If a later line is invalid, the results computed before it should still
+    # be printed before the exception propagates, as they would be unbatched.
+    try:
+        for line in lines:
+            # Plain seconds are the most common input, so try them first before
+            # scanning the line for the other formats.
+            try:
+                seconds = float(line)
+            except ValueError:
+                if ':' in line:
+                    line = hms_to_seconds(line)
+                elif 's' in line:
+                    line = hms_letters_to_seconds(line)
+                else:
+                    raise
+            else:
+                line = seconds
+                if line > 60:
+                    line = seconds_to_hms(line)
+
+            output.append(str(line))
+            if len(output) >= OUTPUT_BATCH_SIZE:
+                pipeable.stdout('\n'.join(output))
+                output.clear()
+    finally:
+        if output:
+            pipeable.stdout('\n'.join(output))
 
 if __name__ == '__main__':
     raise SystemExit(main(sys.argv[1:]))
@@ -241,6 +241,12 @@ class HTTP599(HTTP5XX): pass
 
 _requests_raise_for_status = requests.Response.raise_for_status
 
+_STATUS_CLASSES = {
+    int(name[4:]): cls
+    for (name, cls) in list(globals().items())
+    if name.startswith('HTTP') and name[4:].isdigit()
+}
+
 def monkeypatch_requests():
     '''
     This function will replace requests.Response.raise_for_status with our
@@ -254,7 +260,7 @@ def raise_for_status(response):
     try:
         _requests_raise_for_status(response)
     except requests.exceptions.HTTPError as exc:
-        cls = globals().get(f'HTTP{response.status_code}', None)
+        cls = _STATUS_CLASSES.get(response.status_code, None)
         if not cls:
             raise
 
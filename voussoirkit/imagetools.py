@@ -1,4 +1,3 @@
-import copy
 import datetime
 import dateutil.parser
 import exifread
@@ -17,6 +16,31 @@ for (ORIENTATION_KEY, val) in PIL.ExifTags.TAGS.items():
     if val == 'Orientation':
         break
 
+# In order of preference.
+DATETIME_KEYS = [
+    key
+    for name in ['DateTimeOriginal', 'DateTime', 'DateTimeDigitized']
+    for (key, val) in PIL.ExifTags.TAGS.items()
+    if val == name
+]
+
+# Maps the exif orientation value to the single transpose operation that makes
+# the image upright. Orientations 4, 5, and 7 are a mirror plus a rotation, but
+# PIL can do each of those in one pass.
+ORIENTATION_TRANSPOSES = {
+    2: PIL.Image.FLIP_LEFT_RIGHT,
+    3: PIL.Image.ROTATE_180,
+    4: PIL.Image.FLIP_TOP_BOTTOM,
+    5: PIL.Image.TRANSPOSE,
+    6: PIL.Image.ROTATE_270,
+    7: PIL.Image.TRANSVERSE,
+    8: PIL.Image.ROTATE_90,
+}
+
+# Modes where pasting a color into a box gives the same pixels as
+# Image.new(mode, size, color), so pad_to_square can fill just the borders.
+PAD_FAST_MODES = {'1', 'L', 'LA', 'RGB', 'RGBA'}
+
 def checkerboard_image(color_1, color_2, image_size, checker_size) -> PIL.Image:
     '''
     Generate a PIL Image with a checkerboard pattern.
@@ -70,6 +94,9 @@ def fit_into_bounds(
 
     (1920, 1080, 400, 400) -> (400, 225)
     '''
+    if only_shrink and image_width <= frame_width and image_height <= frame_height:
+        return (image_width, image_height)
+
     width_ratio = frame_width / image_width
     height_ratio = frame_height / image_height
     ratio = min(width_ratio, height_ratio)
@@ -87,21 +114,26 @@ def _get_exif_datetime_pil(image):
     if not exif:
         return
 
-    exif = {
-        PIL.ExifTags.TAGS[key]: value
-        for (key, value) in exif.items()
-        if key in PIL.ExifTags.TAGS
-    }
-    exif_date = exif.get('DateTimeOriginal') or exif.get('DateTime') or exif.get('DateTimeDigitized')
+    # Rather than renaming every tag in the exif, look up the few numeric
+    # tags that we actually care about.
+    for key in DATETIME_KEYS:
+        exif_date = exif.get(key)
+        if exif_date:
+            return exif_date
 
-    if not exif_date:
-        return None
-
-    return exif_date
+    return None
 
 def _get_exif_datetime_exifread(path):
     path = pathclass.Path(path)
-    exif = _exifread.process_file(path.open('rb'))
+    # The date tags are all we need, so skip the makernotes and stop parsing
+    # the exif ifd once we've passed the last of them. Tags within an ifd are
+    # sorted by id, and DateTimeDigitized comes right after DateTimeOriginal.
+    with path.open('rb') as handle:
+        exif = _exifread.process_file(
+            handle,
+            details=False,
+            stop_tag='DateTimeDigitized',
+        )
     exif_date = (
         exif.get('EXIF DateTimeOriginal') or
         exif.get('Image DateTime') or
@@ -150,15 +182,48 @@ def pad_to_square(image, background_color=None) -> PIL.Image:
     if image.size[0] == image.size[1]:
         return image
 
-    dimension = max(image.size)
-    diff_w = int((dimension - image.size[0]) / 2)
-    diff_h = int((dimension - image.size[1]) / 2)
-    new_image = PIL.Image.new(image.mode, (dimension, dimension), background_color)
+    (width, height) = image.size
+    dimension = max(width, height)
+    diff_w = int((dimension - width) / 2)
+    diff_h = int((dimension - height) / 2)
+    if background_color is None or image.mode not in PAD_FAST_MODES:
+        # Image.new knows how to interpret the color for every mode, such as
+        # allocating a palette entry for P or keeping the raw value for I;16,
+        # which pasting a color into a box does not.
+        new_image = PIL.Image.new(image.mode, (dimension, dimension), background_color)
+        new_image.paste(image, (diff_w, diff_h))
+        return new_image
+
+    # The new image is created uninitialized because the interior is about to
+    # be covered by the original image anyway. Only the padding strips need to
+    # be filled with the background color.
+    new_image = PIL.Image.new(image.mode, (dimension, dimension), None)
     new_image.paste(image, (diff_w, diff_h))
+
+    borders = [
+        (0, 0, dimension, diff_h),
+        (0, diff_h + height, dimension, dimension),
+        (0, diff_h, diff_w, diff_h + height),
+        (diff_w + width, diff_h, dimension, diff_h + height),
+    ]
+    for (left, top, right, bottom) in borders:
+        if right > left and bottom > top:
+            new_image.paste(background_color, (left, top, right, bottom))
+
     return new_image
 
-def replace_color(image, from_color, to_color):
-    image = image.copy()
+def replace_color(image, from_color, to_color, *, inplace=False):
+    '''
+    Return an image where every pixel of from_color has been changed to
+    to_color.
+
+    inplace:
+        If True, the given image is modified and returned, instead of a copy.
+        This saves a full copy of the pixel data when you don't need the
+        original anymore.
+    '''
+    if not inplace:
+        image = image.copy()
     pixels = image.load()
     for y in range(image.size[1]):
         for x in range(image.size[0]):
@@ -195,32 +260,16 @@ def rotate_by_exif(image):
     except KeyError:
         return (image, exif)
 
-    fp = getattr(exif, 'fp', None)
-    if isinstance(fp, io.BufferedReader):
-        exif.fp = io.BytesIO()
-        exif.fp.write(fp.read())
-        exif.fp.seek(0)
-    exif = copy.deepcopy(exif)
-
-    if rotation == 1:
-        pass
-    elif rotation == 2:
-        image = image.transpose(PIL.Image.FLIP_LEFT_RIGHT)
-    elif rotation == 3:
-        image = image.transpose(PIL.Image.ROTATE_180)
-    elif rotation == 4:
-        image = image.transpose(PIL.Image.FLIP_LEFT_RIGHT)
-        image = image.transpose(PIL.Image.ROTATE_180)
-    elif rotation == 5:
-        image = image.transpose(PIL.Image.FLIP_LEFT_RIGHT)
-        image = image.transpose(PIL.Image.ROTATE_90)
-    elif rotation == 6:
-        image = image.transpose(PIL.Image.ROTATE_270)
-    elif rotation == 7:
-        image = image.transpose(PIL.Image.FLIP_LEFT_RIGHT)
-        image = image.transpose(PIL.Image.ROTATE_270)
-    elif rotation == 8:
-        image = image.transpose(PIL.Image.ROTATE_90)
+    # The exif returned by getexif is cached on the image, so we should not
+    # modify it in place. Round-tripping through bytes gives us an independent
+    # copy, including the nested IFDs, without deepcopying every node.
+    new_exif = PIL.Image.Exif()
+    new_exif.load(exif.tobytes())
+    exif = new_exif
+
+    transpose = ORIENTATION_TRANSPOSES.get(rotation)
+    if transpose is not None:
+        image = image.transpose(transpose)
 
     exif[ORIENTATION_KEY] = 1
 
@@ -1,6 +1,8 @@
 '''
 This module provides functions for interactive command line UIs.
 '''
+import math
+import string
 import sys
 
 from voussoirkit import pipeable
@@ -9,23 +11,44 @@ def assert_stdin():
     if sys.stdin is None:
         raise RuntimeError('Interactive functions don\'t work when stdin is None.')
 
+def _normalize_answer(answer):
+    '''
+    Strip and lowercase the user's input. Most answers are already lowercase
+    ascii, in which case we can skip making another copy with lower().
+    '''
+    answer = answer.strip()
+    if answer.isascii() and (answer.islower() or not answer):
+        return answer
+    return answer.lower()
+
 ####################################################################################################
 # ABC_CHOOSER ######################################################################################
 ####################################################################################################
 
 def _abc_make_option_letters(options):
-    import math
-    import string
-    from voussoirkit import basenumber
     option_letters = {}
     letter_length = math.ceil(len(options) / 26)
     for (index, option) in enumerate(options):
-        letter = basenumber.to_base(index, 26, alphabet=string.ascii_lowercase)
-        letter = letter.rjust(letter_length, 'a')
-        option_letters[letter] = option
+        # Base 26 where a is zero, pre-padded with a to the common length.
+        letter = ['a'] * letter_length
+        position = letter_length - 1
+        while index:
+            (index, remainder) = divmod(index, 26)
+            letter[position] = string.ascii_lowercase[remainder]
+            position -= 1
+        option_letters[''.join(letter)] = option
 
     return option_letters
 
+def _abc_render_options(option_letters, tostring):
+    '''
+    Return a tuple of (letter, option) pairs with tostring applied to the
+    options, if it was provided.
+    '''
+    if tostring is None:
+        return tuple(option_letters.items())
+    return tuple((letter, tostring(option)) for (letter, option) in option_letters.items())
+
 def abc_chooser(options, *, prompt='', must_pick=False, tostring=None):
     '''
     Given a list of options, the user will pick one by the corresponding letter.
@@ -53,16 +76,16 @@ def abc_chooser(options, *, prompt='', must_pick=False, tostring=None):
     assert_stdin()
 
     option_letters = _abc_make_option_letters(options)
-    if tostring is not None:
-        options_rendered = {letter: tostring(option) for (letter, option) in option_letters.items()}
-    else:
-        options_rendered = option_letters
+    options_rendered = _abc_render_options(option_letters, tostring)
+
+    # The menu doesn't change between attempts, so it only needs to be
+    # rendered once.
+    menu_text = '\n'.join(f'{letter}. {option}' for (letter, option) in options_rendered)
 
     while True:
-        for (letter, option) in options_rendered.items():
-            pipeable.stderr(f'{letter}. {option}')
+        pipeable.stderr(menu_text)
 
-        choice = input(prompt).strip().lower()
+        choice = _normalize_answer(input(prompt))
 
         if not choice:
             if must_pick:
@@ -105,19 +128,25 @@ def abc_chooser_many(options, *, prompt='', label='X', tostring=None) -> list:
     assert_stdin()
 
     option_letters = _abc_make_option_letters(options)
-    if tostring is not None:
-        options_rendered = {letter: tostring(option) for (letter, option) in option_letters.items()}
-    else:
-        options_rendered = option_letters
+    options_rendered = _abc_render_options(option_letters, tostring)
+
+    # Only the labels change between redraws, so the rest of each line is
+    # rendered once up front.
+    menu_parts = [
+        (letter, f'{letter}. [', f'] {option}')
+        for (letter, option) in options_rendered
+    ]
+    blank_label = ' ' * len(label)
 
     selected = set()
     while True:
-        for (letter, option) in options_rendered.items():
-            this_label = label if letter in selected else ''
-            this_label = this_label.center(len(label))
-            pipeable.stderr(f'{letter}. [{this_label}] {option}')
+        lines = []
+        for (letter, prefix, suffix) in menu_parts:
+            this_label = label if letter in selected else blank_label
+            lines.append(f'{prefix}{this_label}{suffix}')
+        pipeable.stderr('\n'.join(lines))
 
-        choice = input(prompt).strip().lower()
+        choice = _normalize_answer(input(prompt))
 
         if not choice:
             break
@@ -172,12 +201,15 @@ def getpermission(
     '''
     assert_stdin()
 
+    yes_set = frozenset(option.lower() for option in yes_strings)
+    no_set = frozenset(option.lower() for option in no_strings)
+
     if prompt is not None:
         pipeable.stderr(prompt)
     while True:
-        answer = input(f'{yes_strings[0]}/{no_strings[0]}> ').strip()
-        yes = answer.lower() in (option.lower() for option in yes_strings)
-        no = answer.lower() in (option.lower() for option in no_strings)
+        answer = _normalize_answer(input(f'{yes_strings[0]}/{no_strings[0]}> '))
+        yes = answer in yes_set
+        no = answer in no_set
         if yes or no or not must_pick:
             break
 
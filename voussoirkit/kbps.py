@@ -14,7 +14,7 @@ from voussoirkit import bytestring
 from voussoirkit import hms
 
 def kbps(time=None, size=None, kbps=None):
-    if [time, size, kbps].count(None) != 1:
+    if (time is None) + (size is None) + (kbps is None) != 1:
         raise ValueError('Incorrect number of unknowns.')
 
     if time is None:
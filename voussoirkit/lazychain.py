@@ -9,17 +9,27 @@ class LazyChain:
     '''
     def __init__(self):
         self.iters = collections.deque()
+        # The iterator currently being consumed is kept out of the deque so
+        # that each call to next doesn't need to index into it.
+        self._head = None
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        while self.iters:
-            try:
-                return next(self.iters[0])
-            except StopIteration:
-                self.iters.popleft()
-        raise StopIteration()
+        head = self._head
+        while True:
+            if head is not None:
+                try:
+                    return next(head)
+                except StopIteration:
+                    pass
+
+            if not self.iters:
+                self._head = None
+                raise StopIteration()
+
+            head = self._head = self.iters.popleft()
 
     def append(self, item):
         '''
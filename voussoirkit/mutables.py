@@ -1,4 +1,6 @@
 class MutableBase:
+    __slots__ = ('_value',)
+
     def __init__(self, value):
         self.set(value)
 
@@ -19,16 +21,19 @@ class MutableBase:
         self._value = value
 
 class Boolean(MutableBase):
-    _types = [bool]
+    __slots__ = ()
+    _types = (bool,)
 
     def __bool__(self):
         return self._value
 
 class Bytes(MutableBase):
-    _types = [bytes]
+    __slots__ = ()
+    _types = (bytes,)
 
 class Float(MutableBase):
-    _types = [int, float]
+    __slots__ = ()
+    _types = (int, float)
 
     def __int__(self):
         return int(self._value)
@@ -37,7 +42,8 @@ class Float(MutableBase):
         return float(self._value)
 
 class Integer(MutableBase):
-    _types = [int]
+    __slots__ = ()
+    _types = (int,)
 
     def __int__(self):
         return int(self._value)
@@ -46,7 +52,8 @@ class Integer(MutableBase):
         return float(self._value)
 
 class String(MutableBase):
-    _types = [str]
+    __slots__ = ()
+    _types = (str,)
 
     def __str__(self):
         return self._value
@@ -18,6 +18,10 @@ log = vlogging.getLogger(__name__, 'networktools')
 # connection. Change it if this server ever becomes unavailable.
 INTERNET_IP = '8.8.8.8'
 
+# Reusing one session lets repeated calls keep their connection alive instead
+# of going through the TCP and TLS handshakes every time.
+session = requests.Session()
+
 class NetworkToolsException(Exception):
     pass
 
@@ -26,7 +30,7 @@ class NoInternet(NetworkToolsException):
 
 def get_external_ip(timeout=10) -> str:
     url = 'https://voussoir.net/whatsmyip'
-    response = requests.get(url, timeout=timeout)
+    response = session.get(url, timeout=timeout)
     httperrors.raise_for_status(response)
     ip = response.text.strip()
     return ip
@@ -53,11 +57,12 @@ def has_internet(timeout=2) -> bool:
     Return True if an internet connection is available. Returns False if the
     timeout expires.
     '''
+    # connect_ex reports failure through its return value, so the common
+    # no-internet case doesn't have to raise and catch an exception.
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        sock.connect((INTERNET_IP, 53))
-        return True
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            return sock.connect_ex((INTERNET_IP, 53)) == 0
     except socket.error as exc:
         return False
 
@@ -84,9 +89,17 @@ def wait_for_internet(timeout, *, backoff=None) -> None:
 
     started = time.time()
     while True:
-        if has_internet(timeout=2):
-            return
-        if time.time() - started >= timeout:
+        # Don't let the individual check run past the overall deadline.
+        remaining = timeout - (time.time() - started)
+        if remaining <= 0:
             raise NoInternet()
+        if has_internet(timeout=min(2, remaining)):
+            return
         if backoff is not None:
-            time.sleep(backoff.next())
+            # Nor the sleep. If there's no time left for another check, there's
+            # no point sleeping before raising.
+            remaining = timeout - (time.time() - started)
+            sleep = min(backoff.next(), remaining)
+            if sleep <= 0:
+                raise NoInternet()
+            time.sleep(sleep)
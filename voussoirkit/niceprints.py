@@ -9,6 +9,7 @@ These functions only do the minimum amount of transformation for their effect.
 You should do your uppercase/lowercase, text wrap, etc. before calling
 these functions.
 '''
+import functools
 import shutil
 
 from voussoirkit import dotdict
@@ -41,12 +42,18 @@ DOUBLE_BOX = dotdict.DotDict(
     side='║',
 )
 
+# Headers and boxes tend to get drawn with the same strings over and over, so
+# it's worth remembering their widths.
+@functools.lru_cache(maxsize=4096)
+def _unicode_width(text):
+    return stringtools.unicode_width(text)
+
 def equals_header(text):
     '''
     Sample text
     ===========
     '''
-    return text + '\n' + ('=' * stringtools.unicode_width(text))
+    return text + '\n' + ('=' * _unicode_width(text))
 
 def in_box(text, *, boxchars=SINGLE_BOX, title=''):
     '''
@@ -65,31 +72,37 @@ def in_box(text, *, boxchars=SINGLE_BOX, title=''):
     it in the box.
     '''
     lines = text.splitlines()
-    widths = {line: stringtools.unicode_width(line) for line in lines}
-    if len(widths) == 0:
-        longest_line = 0
-    else:
-        longest_line = max(widths.values())
+    lines = [(line, _unicode_width(line)) for line in lines]
+    longest_line = max((width for (line, width) in lines), default=0)
 
-    box_width = max(longest_line, stringtools.unicode_width(title))
-    top = title + boxchars.top * (box_width - stringtools.unicode_width(title))
+    title_width = _unicode_width(title)
+    box_width = max(longest_line, title_width)
+    top = title + boxchars.top * (box_width - title_width)
     bottom = boxchars.top * box_width
+    side = boxchars.side
 
     new_lines = []
     new_lines.append(boxchars.upper_left + top + boxchars.upper_right)
-    for line in lines:
-        space_needed = box_width - widths[line]
-        space = ' ' * space_needed
-        new_lines.append(f'{boxchars.side}{line}{space}{boxchars.side}')
+    for (line, width) in lines:
+        # ljust counts characters, not display width, so we adjust the target
+        # length by however many extra columns the wide characters take up.
+        padded = line.ljust(len(line) + box_width - width)
+        new_lines.append(f'{side}{padded}{side}')
     new_lines.append(boxchars.lower_left + bottom + boxchars.lower_right)
     return '\n'.join(new_lines)
 
-def solid_hash_header(text):
+def solid_hash_header(text, *, width=None):
     '''
     # Sample text ##############################################################
+
+    width:
+        The total width of the header. If None, the width of the terminal is
+        used. If you are printing many headers, you can get the terminal size
+        once and pass it in to avoid checking it every time.
     '''
-    cli_width = shutil.get_terminal_size()[0]
+    if width is None:
+        width = shutil.get_terminal_size()[0]
     # One left hash, space, and space after text.
-    right_count = cli_width - (stringtools.unicode_width(text) + 3)
+    right_count = width - (_unicode_width(text) + 3)
     right_hashes = '#' * right_count
     return f'# {text} {right_hashes}'
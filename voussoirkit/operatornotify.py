@@ -36,14 +36,19 @@ Examples:
 > some_process && operatornotify --subject success || operatornotify --subject fail
 > some_process 2>&1 | operatornotify --subject "Results of some_process" --body !i
 '''
-import argparse
+import atexit
+import base64
+import collections
 import contextlib
 import functools
-import io
+import queue
 import sys
+import threading
 import traceback
+import zlib
 
-from voussoirkit import betterhelp
+# import argparse moved to stay lazy.
+# from voussoirkit import betterhelp moved to stay lazy.
 from voussoirkit import dotdict
 from voussoirkit import pipeable
 from voussoirkit import vlogging
@@ -70,6 +75,21 @@ program with the following arguments:
     at the WARNING level if --operatornotify-level isn't used.
 '''
 
+# These are the spellings of the arguments that parse_argv will consume.
+LEVEL_ARGS = frozenset({'--operatornotify_level', '--operatornotify-level'})
+SUBJECT_ARGS = frozenset({'--operatornotify_subject', '--operatornotify-subject'})
+OPT_IN_ARGS = frozenset({'--operatornotify'})
+ALL_ARGS = LEVEL_ARGS | SUBJECT_ARGS | OPT_IN_ARGS
+
+# Formatters don't hold any per-record state, so all of the handlers created by
+# main_log_context can share this one.
+LOG_FORMATTER = vlogging.Formatter(
+    '[{asctime}.{msecs:03.0f}] {levelname}:{name}:{message}',
+    style='{',
+    datefmt='%Y-%m-%dT%H:%M:%S',
+)
+LOG_FORMATTER.default_msec_format = '%s.%03d'
+
 ####################################################################################################
 
 def default_notify(subject, body=''):
@@ -86,7 +106,44 @@ except ImportError:
 
 ####################################################################################################
 
-class LogHandler(vlogging.StreamHandler):
+# LogHandlers with background=True put their (subject, body) pairs onto this
+# queue, and a single worker thread sends them to notify. The thread is only
+# started when the first background handler is created.
+_background_queue = queue.Queue()
+_background_thread = None
+_background_thread_lock = threading.Lock()
+
+def _background_worker():
+    while True:
+        (subject, body) = _background_queue.get()
+        try:
+            notify(subject=subject, body=body)
+        except Exception as exc:
+            traceback.print_exc()
+        finally:
+            _background_queue.task_done()
+
+def _start_background_thread():
+    global _background_thread
+    with _background_thread_lock:
+        if _background_thread is not None:
+            return
+        _background_thread = threading.Thread(target=_background_worker, daemon=True)
+        _background_thread.start()
+        # The thread is a daemon so it won't keep the program alive by itself,
+        # but we don't want to lose notifications that are still in the queue.
+        atexit.register(flush)
+
+def flush():
+    '''
+    Block until all of the notifications queued by background LogHandlers
+    have been sent.
+    '''
+    _background_queue.join()
+
+####################################################################################################
+
+class LogHandler(vlogging.Handler):
     '''
     This handler makes it easy to integrate operatornotify into your
     application that already uses the logging module.
@@ -98,7 +155,18 @@ class LogHandler(vlogging.StreamHandler):
     call handler.notify().
     If no messages have been logged yet, handler.notify will do nothing.
     '''
-    def __init__(self, subject, notify_every_line=False):
+    def __init__(
+            self,
+            subject,
+            notify_every_line=False,
+            *,
+            max_lines=None,
+            background=False,
+            ratelimiter=None,
+            compress=False,
+            capacity=None,
+            flush_interval=None,
+        ):
         '''
         subject:
             The subject string for all notify calls. The body will be the
@@ -112,39 +180,179 @@ class LogHandler(vlogging.StreamHandler):
             errors are being notified, you might want this True. If you're
             writing a command line application where all the results are sent
             at the end, you might want this False.
+
+        max_lines:
+            If not None, only the most recent max_lines log lines are kept in
+            the buffer, and older ones are discarded. This keeps the memory
+            usage of a long-running process bounded if it logs heavily between
+            calls to handler.notify. If None, the buffer is unbounded.
+
+        background:
+            If True, notifications are handed off to a background thread
+            instead of calling notify on the thread that is doing the logging.
+            If your notify function makes network requests, this keeps every
+            log call from waiting on them, which is especially useful with
+            notify_every_line. Errors raised by notify in the background are
+            printed and the message is not retried. Call operatornotify.flush
+            to wait for the queued notifications to finish.
+
+        ratelimiter:
+            An instance of voussoirkit.ratelimiter.Ratelimiter in REJECT mode,
+            used with notify_every_line to prevent a flood of log lines from
+            becoming a flood of notifications. Lines that come in while the
+            limit is exceeded are held in the buffer, and are sent together
+            with the next line that is allowed through, or when handler.notify
+            is called.
+
+        compress:
+            If True, the body is compressed with zlib and base64 encoded before
+            being sent, and the subject is prefixed with "[gz] " so the
+            recipient knows to decode it with
+            zlib.decompress(base64.b64decode(body)).decode('utf-8').
+            Log text tends to be repetitive, so this can greatly reduce the
+            size of large buffered notifications.
+
+        capacity:
+            If not None, the buffer is sent to notify as soon as it holds this
+            many lines, like logging.handlers.MemoryHandler. This is a middle
+            ground between notify_every_line and waiting for handler.notify,
+            so a long-running process sends reasonably sized batches instead
+            of one huge message at the end.
+
+        flush_interval:
+            If not None, a background thread calls handler.notify every
+            flush_interval seconds, so buffered lines don't wait indefinitely
+            for the buffer to fill up. The thread stops when the handler is
+            closed.
         '''
         self.subject = subject
-        self.log_buffer = io.StringIO()
+        self.log_buffer = collections.deque(maxlen=max_lines)
         self.notify_every_line = notify_every_line
-        super().__init__(stream=self.log_buffer)
+        self.background = background
+        self.ratelimiter = ratelimiter
+        self.compress = compress
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        if background:
+            _start_background_thread()
+        super().__init__()
+
+        self._flush_stop = None
+        self._flush_thread = None
+        self._start_flush_thread()
+
+    def _flush_loop(self, stop):
+        while not stop.wait(self.flush_interval):
+            self.notify()
+
+    def _start_flush_thread(self):
+        '''
+        Start the flush_interval thread if this handler has a flush_interval
+        and the thread isn't already running. LogHandlerContext calls this on
+        enter so that a handler can be reused after a previous context stopped
+        its thread.
+        '''
+        if self.flush_interval is None or self._flush_thread is not None:
+            return
+        # Each thread gets its own event so that a stopped thread which hasn't
+        # woken up yet can't be revived by a later start.
+        self._flush_stop = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop,
+            args=(self._flush_stop,),
+            daemon=True,
+        )
+        self._flush_thread.start()
+
+    def _stop_flush_thread(self):
+        if self._flush_thread is None:
+            return
+        self._flush_stop.set()
+        self._flush_thread = None
+
+    def _send(self, text):
+        '''
+        Return True if the text was sent to notify successfully, or was queued
+        for the background thread.
+        '''
+        subject = self.subject
+        if self.compress:
+            subject = '[gz] ' + subject
+            # Level 1 because this is about saving bandwidth on the way out,
+            # not squeezing out every last byte.
+            text = base64.b64encode(zlib.compress(text.encode('utf-8'), 1)).decode('ascii')
+
+        if self.background:
+            _background_queue.put((subject, text))
+            return True
+
+        try:
+            notify(subject=subject, body=text)
+        except Exception as exc:
+            # Normally I'd put this into log.warning or log.error, but then we
+            # might get stuck in an infinite loop! Not sure what's best.
+            traceback.print_exc()
+            return False
+        return True
 
     def emit(self, record):
-        # The StreamHandler emit will write the line into the stringio buffer.
-        super().emit(record)
+        try:
+            text = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        if (
+            self.notify_every_line and
+            self.ratelimiter is not None and
+            not self.ratelimiter.limit()
+        ):
+            self.log_buffer.append(text)
+            return
+
+        if self.notify_every_line and not self.log_buffer:
+            # When every line is sent right away there's no reason to go
+            # through the buffer, unless the send fails and we need to hold on
+            # to the line so it can be retried along with the next one.
+            if not self._send(text):
+                self.log_buffer.append(text)
+            return
+
+        self.log_buffer.append(text)
         if self.notify_every_line:
             self.notify()
+        elif self.capacity is not None and len(self.log_buffer) >= self.capacity:
+            self.notify()
+
+    def close(self):
+        self._stop_flush_thread()
+        super().close()
 
     def notify(self):
         '''
         Send all of the logged contents to notify, then reset the buffer.
         '''
-        text = self.log_buffer.getvalue()
+        # Take the lines out of the buffer under the lock so that another
+        # thread's emit can't slip a line in between the join and the reset,
+        # but don't hold the lock while notify does its (possibly slow) I/O.
+        with self.lock:
+            if not self.log_buffer:
+                return
+            lines = list(self.log_buffer)
+            self.reset_buffer()
 
-        if not text:
+        if self._send('\n'.join(lines)):
             return
 
-        try:
-            notify(subject=self.subject, body=text)
-        except Exception as exc:
-            # Normally I'd put this into log.warning or log.error, but then we
-            # might get stuck in an infinite loop! Not sure what's best.
-            traceback.print_exc()
-        else:
+        # Put the lines back in front of anything logged in the meantime so
+        # they can be retried with the next notify.
+        with self.lock:
+            lines.extend(self.log_buffer)
             self.reset_buffer()
+            self.log_buffer.extend(lines)
 
     def reset_buffer(self):
-        self.log_buffer = io.StringIO()
-        self.setStream(self.log_buffer)
+        self.log_buffer.clear()
 
 class LogHandlerContext:
     '''
@@ -169,24 +377,28 @@ class LogHandlerContext:
         self.handler = handler
 
     def __enter__(self):
+        self.handler._start_flush_thread()
         self.log.addHandler(self.handler)
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
         if exc_type not in (None, KeyboardInterrupt):
-            exc_text = traceback.format_exception(exc_type, exc_value, exc_traceback)
-            exc_text = ''.join(exc_text)
-            exc_text = '\n'.join([
-                'The context was killed by the following exception:',
-                f'{exc_text}'
-            ])
             # Intentionally using module's log, not self.log because I think
             # it should be clear who emitted the message, and the caller can
             # mute this module if they want to.
-            log.error(exc_text)
+            log.error(
+                'The context was killed by the following exception:',
+                exc_info=(exc_type, exc_value, exc_traceback),
+            )
 
         self.handler.notify()
+        if self.handler.background:
+            flush()
         self.log.removeHandler(self.handler)
+        # Stop the flush_interval thread, if any, so it doesn't keep notifying
+        # on a handler that's no longer attached. The handler itself belongs to
+        # the caller and is not closed, so it can be used in another context.
+        self.handler._stop_flush_thread()
 
 def main_decorator(subject, *, log_return_value=True, **context_kwargs):
     '''
@@ -206,10 +418,19 @@ def main_decorator(subject, *, log_return_value=True, **context_kwargs):
     2. Remove those args from argv so your argparse doesn't know the difference.
     3. Wrap main call with main_log_context.
     '''
-    betterhelp.HELPTEXT_EPILOGUES.add(BETTERHELP_EPILOGUE)
     def wrapper(main):
         @functools.wraps(main)
         def wrapped(argv, *main_args, **main_kwargs):
+            # The epilogue is registered when main is called rather than when
+            # it is decorated, so merely importing a module that uses this
+            # decorator doesn't change everyone's helptext.
+            from voussoirkit import betterhelp
+            betterhelp.HELPTEXT_EPILOGUES.add(BETTERHELP_EPILOGUE)
+
+            # Most runs don't opt in, so don't bother parsing in that case.
+            if ALL_ARGS.isdisjoint(argv):
+                return main(argv, *main_args, **main_kwargs)
+
             parsed = parse_argv(argv)
             argv = parsed.argv
 
@@ -232,7 +453,8 @@ def main_decorator(subject, *, log_return_value=True, **context_kwargs):
 def main_log_context(subject, level, **kwargs):
     '''
     Returns a context manager with which you'll wrap your function.
-    Will be nullcontext if the level is None (user did not opt in).
+    Will be nullcontext if the level is None (user did not opt in), or if the
+    level is SILENT since nothing would be captured anyway.
 
     With that context:
     1. A handler is added to the root logger.
@@ -246,17 +468,22 @@ def main_log_context(subject, level, **kwargs):
     if level is None:
         return contextlib.nullcontext()
 
+    # A handler at this level would never receive any records, so there's no
+    # reason to make every log call in the program pass through it.
+    try:
+        level = vlogging.get_level_by_name(level)
+    except (TypeError, ValueError):
+        # Names registered with logging.addLevelName aren't known to vlogging
+        # but are still accepted by setLevel, so pass them along as they are.
+        pass
+    else:
+        if level >= vlogging.SILENT:
+            return contextlib.nullcontext()
+
     log = vlogging.getLogger()
     handler = LogHandler(subject, **kwargs)
     handler.setLevel(level)
-    datefmt = '%Y-%m-%dT%H:%M:%S'
-    formatter = vlogging.Formatter(
-        '[{asctime}.{msecs:03.0f}] {levelname}:{name}:{message}',
-        style='{',
-        datefmt=datefmt,
-    )
-    formatter.default_msec_format = '%s.%03d'
-    handler.setFormatter(formatter)
+    handler.setFormatter(LOG_FORMATTER)
     context = LogHandlerContext(log, handler)
     return context
 
@@ -277,38 +504,42 @@ def parse_argv(argv):
       decisions about when/what to notify. None means did not opt-in.
     - subject, either a string to override the application's subject or None.
 
-    Raises ValueError if --operatornotify-level X is not a recognized level.
+    Raises ValueError if --operatornotify-level X is not a recognized level, or
+    if --operatornotify-level or --operatornotify-subject is the last argument
+    without a value.
     '''
+    def value_of(arg):
+        # Flags that take a value consume the next item from the same iterator
+        # so the for loop doesn't see it.
+        value = next(args, None)
+        if value is None:
+            raise ValueError(f'{arg} needs a value after it.')
+        return value
+
     level = None
     subject = None
     new_argv = []
-    index = 0
-    while index < len(argv):
-        arg = argv[index]
+    args = iter(argv)
+    for arg in args:
+        if arg in LEVEL_ARGS:
+            level = value_of(arg)
 
-        if arg in {'--operatornotify_level', '--operatornotify-level'}:
-            level = argv[index + 1]
-            index += 1
-
-        elif arg in {'--operatornotify_subject', '--operatornotify-subject'}:
+        elif arg in SUBJECT_ARGS:
             if level is None:
                 level = vlogging.WARNING
-            subject = argv[index + 1]
-            index += 1
+            subject = value_of(arg)
 
-        elif arg == '--operatornotify':
+        elif arg in OPT_IN_ARGS:
             if level is None:
                 level = vlogging.WARNING
 
         else:
             new_argv.append(arg)
 
-        index += 1
-
     if isinstance(level, str):
-        try:
+        if level.lstrip('+-').isdecimal():
             level = int(level)
-        except ValueError:
+        else:
             level = vlogging.get_level_by_name(level)
 
     return dotdict.DotDict(
@@ -326,6 +557,9 @@ def operatornotify_argparse(args):
 
 @vlogging.main_decorator
 def main(argv):
+    import argparse
+    from voussoirkit import betterhelp
+
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         '--subject',
@@ -6,6 +6,7 @@ non-cs randomness if it does not.
 If os.urandom(1) gives you a byte, your system has cs randomness.
 '''
 import argparse
+import functools
 import math
 import os
 import random
@@ -13,7 +14,6 @@ import string
 import sys
 
 from voussoirkit import betterhelp
-from voussoirkit import gentools
 from voussoirkit import pipeable
 
 try:
@@ -22,6 +22,65 @@ try:
 except NotImplementedError:
     RNG = random
 
+@functools.lru_cache
+def _make_alphabet(binary, digits, hex, letters, punctuation):
+    '''
+    The alphabet only depends on which options are enabled, so it gets built
+    once per combination instead of on every make_password call.
+    '''
+    alphabet = []
+    if letters:
+        alphabet.append(string.ascii_letters)
+    if digits:
+        alphabet.append(string.digits)
+    if hex:
+        alphabet.append('0123456789abcdef')
+    if binary:
+        alphabet.append('01')
+    if punctuation:
+        alphabet.append(string.punctuation)
+
+    # Overlapping options like hex and digits must not make those characters
+    # more likely, so duplicates are dropped while keeping the order stable.
+    return tuple(dict.fromkeys(''.join(alphabet)))
+
+@functools.lru_cache
+def _make_translate_table(alphabet):
+    '''
+    Each random byte is masked down to the smallest power of two that covers
+    the alphabet. Masked values that land past the end of the alphabet are
+    deleted instead of wrapped around, so every character stays equally
+    likely. Returns (table, deletechars, scale) where scale is the expected
+    number of random bytes needed per output character.
+    '''
+    mask = (1 << (len(alphabet) - 1).bit_length()) - 1
+    alphabet = ''.join(alphabet).encode('ascii')
+    table = bytearray(256)
+    deletechars = bytearray()
+    for b in range(256):
+        index = b & mask
+        if index < len(alphabet):
+            table[b] = alphabet[index]
+        else:
+            deletechars.append(b)
+    scale = (mask + 1) / len(alphabet)
+    return (bytes(table), bytes(deletechars), scale)
+
+def _urandom_choices(alphabet, length):
+    '''
+    Equivalent to RNG.choices(alphabet, k=length) joined into a string, but
+    done with os.urandom and bytes.translate so there's no Python-level work
+    per character.
+    '''
+    (table, deletechars, scale) = _make_translate_table(alphabet)
+    chunks = []
+    need = length
+    while need > 0:
+        chunk = os.urandom(math.ceil(need * scale)).translate(table, deletechars)
+        chunks.append(chunk)
+        need -= len(chunk)
+    return b''.join(chunks)[:length].decode('ascii')
+
 def make_password(
         length,
         *,
@@ -31,31 +90,35 @@ def make_password(
         letters=False,
         punctuation=False,
     ):
-    alphabet = set()
-    if letters:
-        alphabet.update(string.ascii_letters)
-    if digits:
-        alphabet.update(string.digits)
-    if hex:
-        alphabet.update('0123456789abcdef')
-    if binary:
-        alphabet.update('01')
-    if punctuation:
-        alphabet.update(string.punctuation)
+    alphabet = _make_alphabet(binary, digits, hex, letters, punctuation)
 
     if not alphabet:
         raise ValueError('No alphabet options chosen.')
 
-    return ''.join(RNG.choices(tuple(alphabet), k=length))
+    # RNG is only the random module when os.urandom is unavailable.
+    if RNG is not random:
+        return _urandom_choices(alphabet, length)
+
+    return ''.join(RNG.choices(alphabet, k=length))
+
+@functools.lru_cache
+def _get_words():
+    '''
+    The word list is large, so it is imported on first use rather than when
+    this module is imported, and then kept as a tuple for the rest of the
+    program.
+    '''
+    import dictionary.common as common
+    return tuple(common.words)
 
 def make_sentence(length, separator=' '):
     '''
     Returns a string containing `length` words, which come from
     dictionary.common.
     '''
-    import dictionary.common as common
-    words = RNG.choices(common.words, k=length)
-    words = [w.replace(' ', separator) for w in words]
+    words = RNG.choices(_get_words(), k=length)
+    if separator != ' ':
+        words = [w.replace(' ', separator) for w in words]
     result = separator.join(words)
     return result
 
@@ -63,14 +126,13 @@ def random_digits(length):
     '''
     Shortcut function for when you don't want to type the make_password call.
     '''
-    return ''.join(RNG.choices(string.digits, k=length))
+    return make_password(length, digits=True)
 
 def random_hex(length):
     '''
     Shortcut function for when you don't want to type the make_password call.
     '''
-    randbytes = os.urandom(math.ceil(length / 2))
-    token = ''.join('{:02x}'.format(x) for x in randbytes)
+    token = os.urandom(math.ceil(length / 2)).hex()
     token = token[:length]
     return token
 
@@ -79,7 +141,7 @@ def passwordy_argparse(args):
         if args.sentence:
             password = make_sentence(args.length, args.separator)
         else:
-            if not any([args.letters, args.digits, args.hex, args.binary, args.punctuation]):
+            if not (args.letters or args.digits or args.hex or args.binary or args.punctuation):
                 letters = True
                 digits = True
             else:
@@ -99,13 +161,14 @@ def passwordy_argparse(args):
             password = password.upper()
 
         if args.groups_of is not None:
-            chunks = gentools.chunk_generator(password, args.groups_of)
-            chunks = (''.join(chunk) for chunk in chunks)
+            size = args.groups_of
+            chunks = [password[i:i+size] for i in range(0, len(password), size)]
             password = args.separator.join(chunks)
 
-        prefix = args.prefix or ''
-        suffix = args.suffix or ''
-        password = f'{prefix}{password}{suffix}'
+        if args.prefix or args.suffix:
+            prefix = args.prefix or ''
+            suffix = args.suffix or ''
+            password = f'{prefix}{password}{suffix}'
 
         pipeable.stdout(password)
     return 0
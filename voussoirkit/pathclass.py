@@ -13,6 +13,8 @@ if os.name == 'nt':
 else:
     SEPS = {'/'}
 
+NATURAL_SORT_PATTERN = re.compile(r'([0-9]+)')
+
 WINDOWS_GLOBAL_BADCHARS = {'*', '?', '<', '>', '|', '"'}
 WINDOWS_BASENAME_BADCHARS = {'\\', '/', ':', '*', '?', '<', '>', '|', '"'}
 WINDOWS_RESERVED_NAMES = {
@@ -119,6 +121,7 @@ class Path:
             path,
             *,
             _case_correct=False,
+            _parts_normalized=False,
         ):
         '''
         _case_correct:
@@ -126,20 +129,32 @@ class Path:
             known in advance to be correct, which means calls to correct_case
             can be skipped. This is helpful because correct_case can be a
             source of slowdown.
+
+        _parts_normalized:
+            True or False. If True, path must be a tuple that already consists
+            of a Drive and PathParts, such as a slice of another Path's parts,
+            so they don't need to be normalized again. This is helpful because
+            methods like with_child and parent are used heavily by walk and
+            glob.
         '''
         self._case_correct = _case_correct
         self._absolute_path = None
         self._extension = None
+        self._normcase = None
 
         if isinstance(path, Path):
             self._parts = path._parts
             self._absolute_path = path._absolute_path
             self._extension = path._extension
+            self._normcase = path._normcase
             return
 
         if isinstance(path, (tuple, list)):
             if len(path) == 0:
                 raise ValueError('Empty tuple')
+            if _parts_normalized:
+                self._parts = path
+                return
             drive = normalize_drive(path[0])
             parts = tuple(normalize_pathpart(part) for part in path[1:])
             self._parts = (drive, *parts)
@@ -418,7 +433,13 @@ class Path:
 
     @property
     def normcase(self):
-        return os.path.normcase(self.absolute_path)
+        # This is used by __eq__, __hash__, __lt__, and __contains__, so sorting
+        # or hashing many Paths would otherwise normcase each one many times.
+        if self._normcase is not None:
+            return self._normcase
+
+        self._normcase = os.path.normcase(self.absolute_path)
+        return self._normcase
 
     def open(self, *args, **kwargs):
         return open(self, *args, **kwargs)
@@ -428,7 +449,7 @@ class Path:
         if len(self._parts) == 1:
             return self
 
-        return Path(self._parts[:-1], _case_correct=self._case_correct)
+        return Path(self._parts[:-1], _case_correct=self._case_correct, _parts_normalized=True)
 
     def read(self, mode, **kwargs):
         '''
@@ -510,7 +531,7 @@ class Path:
         if self.is_file:
             return os.path.getsize(self)
         elif self.is_dir:
-            return sum(file.size for file in self.walk() if file.is_file)
+            return sum(file.size for file in self.walk_files())
 
     @property
     def stat(self):
@@ -560,17 +581,28 @@ class Path:
         '''
         Yield files from this directory and subdirectories.
         '''
-        # It would be nice to optimize this to not create Path objects for the
-        # directories since we don't yield them, but it's cheaper to do many
-        # directory.with_child(file) than it is to instantiate each file from
-        # the path string anyway.
-        return (item for item in self.walk() if item.is_file)
+        # Use the file type that scandir already gave us instead of walking
+        # everything and then calling is_file on each item, which would cost
+        # another stat per item.
+        directories = []
+
+        entries = os.scandir(self)
+        entries = sorted(entries, key=lambda e: os.path.normcase(e.name))
+        for entry in entries:
+            if entry.is_dir():
+                directories.append(entry.name)
+            elif entry.is_file():
+                yield self.with_child(entry.name, _case_correct=self._case_correct)
+
+        for directory in directories:
+            directory = self.with_child(directory, _case_correct=self._case_correct)
+            yield from directory.walk_files()
 
     def with_child(self, basename, **spawn_kwargs):
         if not isinstance(basename, str):
             raise TypeError(f'basename must be {str}, not {type(basename)}.')
-        parts = (*self._parts, basename)
-        return Path(parts, **spawn_kwargs)
+        parts = (*self._parts, normalize_pathpart(basename))
+        return Path(parts, _parts_normalized=True, **spawn_kwargs)
 
     def write(self, mode, data, **kwargs):
         '''
@@ -602,13 +634,11 @@ def common_path(paths, fallback):
     if len(paths) == 0:
         raise ValueError('Empty list')
 
+    # zip stops at the shortest path, so we only need to look for the first
+    # level where the paths disagree.
     index = 0
-    while True:
-        try:
-            this_level = set(os.path.normcase(path._parts[index]._name) for path in paths)
-        except IndexError:
-            break
-        if len(this_level) > 1:
+    for this_level in zip(*(path._parts for path in paths)):
+        if len(set(os.path.normcase(part._name) for part in this_level)) > 1:
             break
         index += 1
 
@@ -616,7 +646,7 @@ def common_path(paths, fallback):
         return fallback
 
     parts = paths[0]._parts[:index]
-    return Path(parts)
+    return Path(parts, _parts_normalized=True)
 
 def cwd():
     return Path(os.getcwd())
@@ -763,7 +793,7 @@ def natural_sorter(path):
     http://stackoverflow.com/a/11150413
     '''
     convert = lambda text: int(text) if text.isdigit() else text.lower()
-    alphanum_key = lambda key: [convert(c) for c in re.split('([0-9]+)', key.absolute_path)]
+    alphanum_key = lambda key: [convert(c) for c in NATURAL_SORT_PATTERN.split(key.absolute_path)]
     return alphanum_key(path)
 
 def normalize_drive(name):
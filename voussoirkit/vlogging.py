@@ -39,6 +39,16 @@ LOUD = 1
 SILENT = 99999999999
 
 ARGV_LEVEL = NOTSET
+
+# These are the arguments recognized by get_level_by_argv, in order of
+# precedence if more than one is given.
+ARGV_LEVELS = {
+    '--loud': LOUD,
+    '--debug': DEBUG,
+    '--warning': WARNING,
+    '--quiet': ERROR,
+    '--silent': SILENT,
+}
 _did_earlybird = False
 
 def add_loud(log):
@@ -119,29 +129,20 @@ def get_level_by_argv(argv):
     --silent: SILENT
     none of the above: INFO
     '''
-    argv = argv[:]
-
-    def tryremove(lst, item):
-        try:
-            lst.remove(item)
-            return True
-        except ValueError:
-            return False
-
-    if tryremove(argv, '--loud'):
-        level = LOUD
-    elif tryremove(argv, '--debug'):
-        level = DEBUG
-    elif tryremove(argv, '--warning'):
-        level = WARNING
-    elif tryremove(argv, '--quiet'):
-        level = ERROR
-    elif tryremove(argv, '--silent'):
-        level = SILENT
-    else:
-        level = INFO
+    # Find the first occurrence of each flag in one pass, instead of searching
+    # the whole argv once per flag.
+    first_index = {}
+    for (index, arg) in enumerate(argv):
+        if arg in ARGV_LEVELS:
+            first_index.setdefault(arg, index)
+
+    # ARGV_LEVELS is in order of precedence.
+    for (arg, level) in ARGV_LEVELS.items():
+        index = first_index.get(arg)
+        if index is not None:
+            return (level, argv[:index] + argv[index+1:])
 
-    return (level, argv)
+    return (INFO, argv[:])
 
 def get_level_by_name(name):
     '''
@@ -207,11 +208,14 @@ def main_decorator(main):
     to use --debug, --quiet, etc. on the command line without making any
     changes to your argparser.
     '''
-    from voussoirkit import betterhelp
-    betterhelp.HELPTEXT_EPILOGUES.add(BETTERHELP_EPILOGUE)
     @functools.wraps(main)
     def wrapped(argv, *args, **kwargs):
         global ARGV_LEVEL
+        # Registering the epilogue here instead of when the decorator is
+        # applied means that merely importing a module with a decorated main
+        # does not pull in betterhelp and argparse.
+        from voussoirkit import betterhelp
+        betterhelp.HELPTEXT_EPILOGUES.add(BETTERHELP_EPILOGUE)
         # The reason we don't call basic_config is that another module may have
         # attached a root handler for another purpose.
         # However we do check _did_earlybird so that we don't get double